@@ -8,10 +8,51 @@ Google News RSS를 활용하여 동반성장 지수 평가 관련 뉴스를 수
 import streamlit as st
 import pandas as pd
 import json
+import re
+import asyncio
+import hashlib
+import uuid
 from datetime import datetime
-import time
-from collections import Counter
 import io
+import os
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick이 없으면 정규식으로 관련 키워드 검사
+    ahocorasick = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow가 없으면 pandas CSV writer 사용
+    pa = None
+    pacsv = None
+
+# 키워드 동시 수집 요청 수 상한
+MAX_CONCURRENT_REQUESTS = 8
+
+# 데모 모드(DEMO_MODE=1)에서만 네트워크 지연을 흉내 내는 대기 시간을 둠
+DEMO_MODE = os.getenv("DEMO_MODE") == "1"
+
+# 관련 뉴스 판별용 키워드
+RELEVANT_KEYWORDS = [
+    "동반성장", "공정거래", "공정위", "협약", "실적평가", "이행평가",
+    "상생", "협력사", "하도급", "중소기업", "대기업"
+]
+
+# 제목 SimHash 중복 판정 기준 (64비트 중 서로 다른 비트 수가 이하이면 중복)
+SIMHASH_DISTANCE = 3
+# 지문을 16비트씩 나눈 밴드 수 (밴드 수가 기준 거리보다 크면 기준 이내 쌍은 최소 한 밴드가 완전히 같음)
+SIMHASH_BANDS = 4
+TITLE_SOURCE_SUFFIX = re.compile(r'\s+-\s+[^-]+$')
+
+# 크롤링 시 미리 계산해 두는 검색용 소문자 컬럼 (내보내기에서는 제외)
+SEARCH_COLUMNS = ['_title_lower', '_summary_lower']
 
 # 페이지 설정
 st.set_page_config(
@@ -21,145 +62,321 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 커스텀 CSS - 미니멀 트렌디 디자인
-st.markdown("""
-<style>
-    /* 전체 테마 - 미니멀 흰색/회색 */
-    .main {
-        background-color: #ffffff;
-    }
-    
-    .stApp {
-        background-color: #ffffff;
-    }
-    
-    /* 헤더 스타일 */
-    .main-header {
-        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-        padding: 2rem 0;
-        margin-bottom: 2rem;
-        border-radius: 12px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.05);
-    }
-    
-    .main-title {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #2c3e50;
-        text-align: center;
-        margin: 0;
-        letter-spacing: -0.02em;
-    }
-    
-    .main-subtitle {
-        font-size: 1.1rem;
-        color: #6c757d;
-        text-align: center;
-        margin-top: 0.5rem;
-        font-weight: 400;
-    }
-    
-    /* 카드 스타일 */
-    .metric-card {
-        background: #ffffff;
-        border: 1px solid #e9ecef;
-        border-radius: 12px;
-        padding: 1.5rem;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.03);
-        transition: all 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-        transform: translateY(-2px);
-    }
-    
-    /* 버튼 스타일 */
-    .stButton > button {
-        background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        font-size: 1rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 2px 10px rgba(44, 62, 80, 0.2);
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #34495e 0%, #2c3e50 100%);
-        transform: translateY(-1px);
-        box-shadow: 0 4px 20px rgba(44, 62, 80, 0.3);
-    }
-    
-    /* 메트릭 스타일 */
-    .metric-container {
-        background: #ffffff;
-        border: 1px solid #e9ecef;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.03);
-    }
-    
-    .metric-value {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #2c3e50;
-        margin: 0;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        color: #6c757d;
-        margin: 0;
-        font-weight: 500;
-    }
-    
-    /* 차트 컨테이너 */
-    .chart-container {
-        background: #ffffff;
-        border: 1px solid #e9ecef;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.03);
-    }
-    
-    /* 애니메이션 */
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(20px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    .fade-in {
-        animation: fadeIn 0.6s ease-out;
-    }
-    
-    /* 성공/경고 메시지 */
-    .stSuccess {
-        background: linear-gradient(135deg, #d4edda 0%, #c3e6cb 100%);
-        border: 1px solid #c3e6cb;
-        border-radius: 8px;
-        color: #155724;
-    }
-    
-    .stWarning {
-        background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%);
-        border: 1px solid #ffeaa7;
-        border-radius: 8px;
-        color: #856404;
-    }
-    
-    .stInfo {
-        background: linear-gradient(135deg, #d1ecf1 0%, #bee5eb 100%);
-        border: 1px solid #bee5eb;
-        border-radius: 8px;
-        color: #0c5460;
-    }
-</style>
-""", unsafe_allow_html=True)
+# 커스텀 CSS - 미니멀 트렌디 디자인 (style.css)
+@st.cache_resource
+def load_css():
+    """
+    style.css를 읽어 <style> 태그로 감싼 문자열을 반환합니다.
+    파일은 프로세스당 한 번만 읽고, 이후 재실행에서는 캐시된 문자열을 사용합니다.
+    """
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'style.css')
+    with open(css_path, encoding='utf-8') as f:
+        return f"<style>\n{f.read()}</style>"
+
+st.markdown(load_css(), unsafe_allow_html=True)
+
+async def fetch_keyword_news(keyword, max_results, semaphore):
+    """
+    키워드 하나에 대한 뉴스를 비동기로 수집합니다. (시뮬레이션)
+    실제 크롤러에서는 대기 구간이 Google News RSS 요청이 되며, semaphore로 동시 요청 수를 제한합니다.
+    """
+    async with semaphore:
+        if DEMO_MODE:
+            await asyncio.sleep(0.5)  # 시뮬레이션
+    
+    # 수집 시각은 기사마다가 아니라 요청당 한 번만 계산
+    now = datetime.now()
+    published = now.strftime("%Y-%m-%d %H:%M:%S")
+    crawled_at = now.isoformat()
+    
+    articles = []
+    for j in range(max_results):
+        article = {
+            'title': f"{keyword} 관련 뉴스 {j+1}",
+            'link': f"https://example.com/news/{j+1}",
+            'published': published,
+            'summary': f"{keyword}에 대한 상세한 내용입니다.",
+            'source': f"뉴스출처{j+1}",
+            'keyword': keyword,
+            'crawled_at': crawled_at
+        }
+        articles.append(article)
+    
+    return keyword, articles
+
+async def crawl_keywords(keywords, max_results):
+    """
+    키워드별 수집을 동시에 실행하고 선택한 키워드 순서대로 병합한 기사 목록을 반환합니다.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    results = await asyncio.gather(
+        *(fetch_keyword_news(keyword, max_results, semaphore) for keyword in keywords)
+    )
+    return [article for _, articles in results for article in articles]
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def fetch_news(keywords, max_results):
+    """
+    선택한 키워드 전체에 대한 뉴스를 수집합니다.
+    같은 (키워드 tuple, 최대 뉴스 수) 조합은 1시간 동안 캐시되어 네트워크 요청 없이 반환됩니다.
+    캐시 재생과 충돌하지 않도록 Streamlit 출력은 사용하지 않습니다.
+    - keywords: 검색 키워드 tuple (캐시 키로 쓰이므로 hashable)
+    - max_results: 전체 최대 뉴스 수 (키워드 수로 나누어 배분)
+    """
+    return asyncio.run(crawl_keywords(keywords, max_results // len(keywords)))
+
+@st.cache_resource
+def get_relevance_matcher(keywords):
+    """
+    텍스트에 키워드 중 하나라도 포함되어 있는지 검사하는 함수를 반환합니다.
+    pyahocorasick이 있으면 Aho-Corasick 오토마톤으로 키워드 수와 무관하게 텍스트를 한 번만 훑고,
+    없으면 모든 키워드를 묶은 정규식 하나로 검사합니다.
+    - keywords: 관련 키워드 tuple
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    pattern = re.compile('|'.join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
+
+def filter_relevant_news(articles):
+    """
+    제목이나 요약에 관련 키워드가 포함된 기사만 반환합니다.
+    한글 키워드는 대소문자 구분이 없으므로 소문자 변환 없이 검사합니다.
+    """
+    is_relevant = get_relevance_matcher(tuple(RELEVANT_KEYWORDS))
+    return [
+        article for article in articles
+        if is_relevant(article.get('title', '')) or is_relevant(article.get('summary', ''))
+    ]
+
+def simhash64(text):
+    """
+    텍스트 토큰으로 64비트 SimHash 지문을 계산합니다.
+    비슷한 문장일수록 지문 간 해밍 거리가 작습니다.
+    """
+    votes = [0] * 64
+    for token in re.findall(r'\w+', text.lower()):
+        token_hash = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            votes[bit] += 1 if token_hash >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if votes[bit] > 0)
+
+def remove_near_duplicates(articles):
+    """
+    제목이 거의 같은 기사(여러 매체에 전재된 기사 등)는 처음 나온 것만 남기고 제거합니다.
+    SimHash 지문을 16비트 밴드로 나누어 밴드별로 색인하고, 같은 밴드 값을 가진 후보끼리만
+    해밍 거리를 비교하므로 전체 쌍을 비교하지 않으면서도 기준 거리 이내의 중복은 놓치지 않습니다.
+    """
+    band_index = {}
+    unique_articles = []
+    for article in articles:
+        # Google News 제목 끝의 ' - 매체명'은 전재 기사마다 달라지므로 지문에서 제외
+        title = TITLE_SOURCE_SUFFIX.sub('', article.get('title', ''))
+        fingerprint = simhash64(title)
+        band_keys = [(band, fingerprint >> (16 * band) & 0xFFFF) for band in range(SIMHASH_BANDS)]
+        if any((fingerprint ^ other).bit_count() <= SIMHASH_DISTANCE
+               for key in band_keys for other in band_index.get(key, ())):
+            continue
+        for key in band_keys:
+            band_index.setdefault(key, []).append(fingerprint)
+        unique_articles.append(article)
+    return unique_articles
+
+def filter_and_sort_news(news_df, search_term, keyword_filter, source_filter, sort_option):
+    """
+    수집된 뉴스 DataFrame에 검색어/키워드/출처 필터와 정렬을 적용합니다.
+    - news_df: 크롤링 결과 DataFrame
+    """
+    # 모든 조건을 하나의 불리언 마스크로 합쳐 중간 DataFrame 복사 없이 한 번만 인덱싱
+    mask = pd.Series(True, index=news_df.index)
+    
+    if search_term:
+        term = search_term.lower()
+        mask &= (news_df['_title_lower'].str.contains(term, regex=False, na=False) |
+                 news_df['_summary_lower'].str.contains(term, regex=False, na=False))
+    
+    if keyword_filter != "전체":
+        mask &= news_df['keyword'] == keyword_filter
+    
+    if source_filter != "전체":
+        mask &= news_df['source'] == source_filter
+    
+    filtered_df = news_df[mask]
+    
+    # 정렬 (기존 list.sort와 같은 안정 정렬)
+    if sort_option == "최신순":
+        filtered_df = filtered_df.sort_values('published', ascending=False, kind='stable')
+    elif sort_option == "제목순":
+        filtered_df = filtered_df.sort_values('title', kind='stable')
+    elif sort_option == "출처순":
+        filtered_df = filtered_df.sort_values('source', kind='stable')
+    
+    return filtered_df
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def to_json_bytes(_df, crawl_id, search_term, keyword_filter, source_filter, sort_option):
+    """
+    필터링된 뉴스 DataFrame을 검색용 컬럼을 제외한 UTF-8 JSON bytes(레코드 배열)로 직렬화합니다.
+    같은 조건의 결과는 캐시되어 재실행마다 다시 직렬화하지 않으며, 기계가 읽는 파일이므로 들여쓰기는 하지 않습니다.
+    orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 버퍼에 바로 기록합니다.
+    - _df: 필터링/정렬된 DataFrame (해시하지 않고 crawl_id와 필터 조건으로 구분)
+    - crawl_id: 크롤링마다 새로 발급되는 식별자
+    """
+    records = _df.drop(columns=SEARCH_COLUMNS).to_dict('records')
+    if orjson is not None:
+        return orjson.dumps(records, option=orjson.OPT_NON_STR_KEYS)
+    
+    # json.dump는 인코딩된 조각을 버퍼에 바로 기록하므로 전체 문자열을 따로 만들지 않음
+    buffer = io.BytesIO()
+    writer = io.TextIOWrapper(buffer, encoding='utf-8')
+    json.dump(records, writer, ensure_ascii=False)
+    writer.flush()
+    writer.detach()
+    return buffer.getvalue()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def to_csv_bytes(_df, crawl_id, search_term, keyword_filter, source_filter, sort_option):
+    """
+    필터링된 뉴스 DataFrame을 검색용 컬럼을 제외하고 Excel에서 바로 열리는 UTF-8(BOM 포함) CSV bytes로 직렬화합니다.
+    같은 조건의 결과는 캐시되어 재실행마다 다시 직렬화하지 않습니다.
+    pyarrow가 설치되어 있으면 C++ CSV writer를 사용하고, 없으면 pandas로 기록합니다.
+    - _df: 필터링/정렬된 DataFrame (해시하지 않고 crawl_id와 필터 조건으로 구분)
+    - crawl_id: 크롤링마다 새로 발급되는 식별자
+    """
+    df = _df.drop(columns=SEARCH_COLUMNS)
+    if pacsv is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            # 자료형이 섞인 object 컬럼은 Arrow로 변환할 수 없으므로 pandas로 기록
+            table = None
+        if table is not None:
+            buffer = io.BytesIO()
+            pacsv.write_csv(table, buffer)
+            # utf-8-sig와 같은 결과가 되도록 BOM을 앞에 붙임
+            return b'\xef\xbb\xbf' + buffer.getvalue()
+    
+    # 바이너리 버퍼에 청크 단위로 기록
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8-sig', chunksize=1000)
+    return buffer.getvalue()
+
+@st.fragment
+def news_view(news_df):
+    """
+    수집된 뉴스의 검색/필터링, 목록, 내보내기 영역을 렌더링합니다.
+    fragment로 분리되어 있어 이 영역의 위젯을 조작하면 크롤링/통계 영역은 다시 실행되지 않습니다.
+    - news_df: 크롤링 결과 DataFrame
+    """
+    st.markdown("---")
+    st.markdown("### 📰 수집된 뉴스")
+    
+    # 검색 및 필터링 섹션
+    st.markdown("#### 🔍 검색 및 필터링")
+    
+    # 검색창
+    search_term = st.text_input("", placeholder="제목이나 내용으로 검색...", key="search_input")
+    
+    # 필터 옵션들
+    col_filter1, col_filter2, col_filter3 = st.columns(3)
+    
+    with col_filter1:
+        keyword_filter = st.selectbox("키워드 필터:", ["전체", *st.session_state['unique_keywords']], key="kw_filter")
+    
+    with col_filter2:
+        source_filter = st.selectbox("출처 필터:", ["전체", *st.session_state['unique_sources']], key="src_filter")
+    
+    with col_filter3:
+        sort_option = st.selectbox("정렬:", ["최신순", "제목순", "출처순"], key="sort_option")
+    
+    # 필터링/정렬 결과는 세션에 (크롤링, 필터 조건)과 함께 보관하여 페이지 이동 시에는 같은 객체를 슬라이스만 함
+    # (cache_data는 적중할 때마다 DataFrame 전체를 역직렬화하므로 다시 계산하는 것보다 느림)
+    view_key = (st.session_state['crawl_id'], search_term, keyword_filter, source_filter, sort_option)
+    filtered_view = st.session_state.get('filtered_view')
+    if filtered_view is None or filtered_view['key'] != view_key:
+        filtered_view = {
+            'key': view_key,
+            'df': filter_and_sort_news(news_df, search_term, keyword_filter, source_filter, sort_option)
+        }
+        st.session_state['filtered_view'] = filtered_view
+    filtered_df = filtered_view['df']
+    
+    # 페이지네이션
+    items_per_page = 10
+    total_pages = (len(filtered_df) + items_per_page - 1) // items_per_page
+    if total_pages > 1:
+        current_page = st.selectbox("페이지:", range(1, total_pages + 1), index=0)
+    else:
+        current_page = 1
+    
+    start_idx = (current_page - 1) * items_per_page
+    end_idx = start_idx + items_per_page
+    page_df = filtered_df.iloc[start_idx:end_idx][['title', 'source', 'keyword', 'published', 'summary', 'link']]
+    
+    # 뉴스 목록 표시 (기본은 하나의 테이블로 전송, 상세 보기에서만 기사별 카드 렌더링)
+    st.markdown("#### 📋 뉴스 목록")
+    detailed_view = st.toggle("상세 보기", value=False, key="detailed_view")
+    
+    if detailed_view:
+        for article in page_df.to_dict('records'):
+            with st.expander(f"📰 {article['title'][:80]}...", expanded=False):
+                details = [
+                    f"**📰 출처:** {article['source']}",
+                    f"**🔍 키워드:** {article['keyword']}",
+                    f"**📅 발행일:** {article['published']}"
+                ]
+                if article.get('summary'):
+                    details.append(f"**📝 요약:** {article['summary'][:200]}...")
+                details.append(f"[🔗 기사 보기]({article['link']})")
+                st.markdown("\n\n".join(details))
+    else:
+        st.dataframe(
+            page_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'title': st.column_config.TextColumn("📰 제목"),
+                'source': st.column_config.TextColumn("출처"),
+                'keyword': st.column_config.TextColumn("🔍 키워드"),
+                'published': st.column_config.TextColumn("📅 발행일"),
+                'summary': st.column_config.TextColumn("📝 요약"),
+                'link': st.column_config.LinkColumn("🔗", display_text="기사 보기")
+            }
+        )
+    
+    # 데이터 내보내기 섹션 (DataFrame은 해시하지 않고 목록과 같은 (크롤링, 필터 조건)으로 캐시)
+    st.markdown("---")
+    st.markdown("### 💾 데이터 내보내기")
+    
+    col_export1, col_export2, col_export3 = st.columns(3)
+    
+    with col_export1:
+        json_data = to_json_bytes(filtered_df, *view_key)
+        st.download_button(
+            label="📄 JSON 다운로드",
+            data=json_data,
+            file_name=f"동반성장_뉴스_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json",
+            use_container_width=True
+        )
+    
+    with col_export2:
+        csv_data = to_csv_bytes(filtered_df, *view_key)
+        st.download_button(
+            label="📊 CSV 다운로드",
+            data=csv_data,
+            file_name=f"동반성장_뉴스_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    
+    with col_export3:
+        st.info("📈 Excel 다운로드는 실제 크롤링 시 사용 가능합니다.")
 
 def main():
     # 헤더 섹션
@@ -205,182 +422,73 @@ def main():
             if not selected_keywords:
                 st.warning("검색할 키워드를 선택해주세요.")
             else:
-                # 진행바와 상태 표시
-                progress_bar = st.progress(0)
-                status_text = st.empty()
+                # 수집 결과는 키워드 조합별로 캐시되어, 같은 조건의 재요청은 즉시 반환
+                with st.spinner(f"🔍 검색 중: {', '.join(selected_keywords)}"):
+                    all_articles = fetch_news(tuple(selected_keywords), max_results)
                 
-                # 시뮬레이션된 크롤링
-                all_articles = []
-                for i, keyword in enumerate(selected_keywords):
-                    status_text.text(f"🔍 검색 중: {keyword}")
-                    progress_bar.progress((i + 1) / len(selected_keywords))
-                    
-                    # 시뮬레이션된 뉴스 데이터
-                    for j in range(max_results // len(selected_keywords)):
-                        article = {
-                            'title': f"{keyword} 관련 뉴스 {j+1}",
-                            'link': f"https://example.com/news/{j+1}",
-                            'published': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                            'summary': f"{keyword}에 대한 상세한 내용입니다.",
-                            'source': f"뉴스출처{j+1}",
-                            'keyword': keyword,
-                            'crawled_at': datetime.now().isoformat()
-                        }
-                        all_articles.append(article)
-                    
-                    time.sleep(0.5)  # 시뮬레이션
+                if filter_relevant:
+                    all_articles = filter_relevant_news(all_articles)
                 
-                # 세션 상태에 저장
-                st.session_state['news_data'] = all_articles
-                st.session_state['crawl_time'] = datetime.now()
+                if remove_duplicates:
+                    all_articles = remove_near_duplicates(all_articles)
                 
-                status_text.text("✅ 크롤링 완료!")
-                progress_bar.progress(1.0)
+                # 세션 상태에는 DataFrame만 저장 (필터링/정렬/내보내기 모두 컬럼 단위 벡터 연산)
+                news_df = pd.DataFrame(all_articles)
+                if not news_df.empty:
+                    # 검색용 소문자 컬럼은 키 입력마다 다시 만들지 않도록 미리 계산
+                    news_df['_title_lower'] = news_df['title'].str.lower()
+                    news_df['_summary_lower'] = news_df['summary'].str.lower()
+                st.session_state['news_df'] = news_df
+                # 통계는 데이터가 바뀔 때(크롤링 완료 시)만 계산해 재실행마다 반복하지 않음
+                # 필터 선택지도 크롤링 시 한 번만 구성 (키워드는 선택 순서 유지, 출처는 가나다순)
+                if news_df.empty:
+                    st.session_state['stats'] = {'by_kw': pd.Series(dtype='int64'), 'by_src': pd.Series(dtype='int64')}
+                    st.session_state['unique_keywords'] = []
+                    st.session_state['unique_sources'] = []
+                else:
+                    sources = news_df['source'].dropna()
+                    sources = sources[sources != '']
+                    st.session_state['stats'] = {
+                        'by_kw': news_df['keyword'].value_counts(),
+                        'by_src': sources.value_counts()
+                    }
+                    st.session_state['unique_keywords'] = news_df['keyword'].unique().tolist()
+                    st.session_state['unique_sources'] = sorted(sources.unique().tolist())
+                st.session_state['crawl_time'] = datetime.now()
+                st.session_state['crawl_id'] = uuid.uuid4().hex
                 
                 st.success(f"🎉 총 {len(all_articles)}개의 뉴스를 수집했습니다.")
     
     with col2:
         st.markdown("### 📊 실시간 통계")
         
-        if 'news_data' in st.session_state:
-            news_data = st.session_state['news_data']
+        if 'news_df' in st.session_state:
+            news_df = st.session_state['news_df']
             
             # 통계 카드들
             col_stat1, col_stat2 = st.columns(2)
             
-            with col_stat1:
-                st.markdown("""
-                <div class="metric-container">
-                    <div class="metric-value">{}</div>
-                    <div class="metric-label">총 뉴스 수</div>
-                </div>
-                """.format(len(news_data)), unsafe_allow_html=True)
-            
-            with col_stat2:
-                st.markdown("""
-                <div class="metric-container">
-                    <div class="metric-value">{}</div>
-                    <div class="metric-label">검색 키워드</div>
-                </div>
-                """.format(len(selected_keywords)), unsafe_allow_html=True)
+            col_stat1.metric("총 뉴스 수", len(news_df))
+            col_stat2.metric("검색 키워드", len(selected_keywords))
             
-            # 키워드별 통계
-            keyword_counts = Counter([article['keyword'] for article in news_data])
-            st.markdown("**🔍 키워드별 뉴스 수:**")
-            for keyword, count in keyword_counts.most_common(5):
-                st.markdown(f"• **{keyword}**: {count}개")
-            
-            # 출처별 통계
-            source_counts = Counter([article['source'] for article in news_data if article['source']])
-            st.markdown("**📰 주요 출처:**")
-            for source, count in source_counts.most_common(3):
-                st.markdown(f"• **{source}**: {count}개")
+            # 키워드별/출처별 통계 (항목마다 st.markdown을 호출하지 않고 한 번에 출력)
+            # 집계가 비어 있는 항목은 제목만 남지 않도록 건너뜀
+            stats = st.session_state['stats']
+            stat_lines = []
+            if not stats['by_kw'].empty:
+                stat_lines.append("**🔍 키워드별 뉴스 수:**")
+                stat_lines.extend(f"• **{keyword}**: {count}개" for keyword, count in stats['by_kw'].head(5).items())
+            if not stats['by_src'].empty:
+                stat_lines.append("**📰 주요 출처:**")
+                stat_lines.extend(f"• **{source}**: {count}개" for source, count in stats['by_src'].head(3).items())
+            if stat_lines:
+                st.markdown("\n\n".join(stat_lines))
         else:
             st.info("💡 뉴스를 수집하면 통계가 표시됩니다.")
     
     # 뉴스 데이터 표시
-    if 'news_data' in st.session_state and st.session_state['news_data']:
-        st.markdown("---")
-        st.markdown("### 📰 수집된 뉴스")
-        
-        # 검색 및 필터링 섹션
-        st.markdown("#### 🔍 검색 및 필터링")
-        
-        # 검색창
-        search_term = st.text_input("", placeholder="제목이나 내용으로 검색...", key="search_input")
-        
-        # 필터 옵션들
-        col_filter1, col_filter2, col_filter3 = st.columns(3)
-        
-        with col_filter1:
-            keyword_filter = st.selectbox("키워드 필터:", ["전체"] + list(set([article['keyword'] for article in st.session_state['news_data']])))
-        
-        with col_filter2:
-            source_filter = st.selectbox("출처 필터:", ["전체"] + list(set([article['source'] for article in st.session_state['news_data'] if article['source']])))
-        
-        with col_filter3:
-            sort_option = st.selectbox("정렬:", ["최신순", "제목순", "출처순"])
-        
-        # 데이터 필터링
-        filtered_data = st.session_state['news_data'].copy()
-        
-        if search_term:
-            filtered_data = [article for article in filtered_data 
-                           if search_term.lower() in article['title'].lower() or 
-                           search_term.lower() in article.get('summary', '').lower()]
-        
-        if keyword_filter != "전체":
-            filtered_data = [article for article in filtered_data if article['keyword'] == keyword_filter]
-        
-        if source_filter != "전체":
-            filtered_data = [article for article in filtered_data if article['source'] == source_filter]
-        
-        # 정렬
-        if sort_option == "최신순":
-            filtered_data.sort(key=lambda x: x.get('published', ''), reverse=True)
-        elif sort_option == "제목순":
-            filtered_data.sort(key=lambda x: x.get('title', ''))
-        elif sort_option == "출처순":
-            filtered_data.sort(key=lambda x: x.get('source', ''))
-        
-        # 페이지네이션
-        items_per_page = 10
-        total_pages = (len(filtered_data) + items_per_page - 1) // items_per_page
-        if total_pages > 1:
-            current_page = st.selectbox("페이지:", range(1, total_pages + 1), index=0)
-        else:
-            current_page = 1
-        
-        start_idx = (current_page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        page_data = filtered_data[start_idx:end_idx]
-        
-        # 뉴스 카드 표시
-        st.markdown("#### 📋 뉴스 목록")
-        for i, article in enumerate(page_data):
-            with st.expander(f"📰 {article['title'][:80]}...", expanded=False):
-                col_info, col_link = st.columns([3, 1])
-                
-                with col_info:
-                    st.markdown(f"**📰 출처:** {article['source']}")
-                    st.markdown(f"**🔍 키워드:** {article['keyword']}")
-                    st.markdown(f"**📅 발행일:** {article['published']}")
-                    
-                    if article.get('summary'):
-                        st.markdown(f"**📝 요약:** {article['summary'][:200]}...")
-                
-                with col_link:
-                    st.markdown(f"[🔗 기사 보기]({article['link']})")
-        
-        # 데이터 내보내기 섹션
-        st.markdown("---")
-        st.markdown("### 💾 데이터 내보내기")
-        
-        col_export1, col_export2, col_export3 = st.columns(3)
-        
-        with col_export1:
-            json_data = json.dumps(filtered_data, ensure_ascii=False, indent=2)
-            st.download_button(
-                label="📄 JSON 다운로드",
-                data=json_data,
-                file_name=f"동반성장_뉴스_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json",
-                use_container_width=True
-            )
-        
-        with col_export2:
-            df = pd.DataFrame(filtered_data)
-            csv_data = df.to_csv(index=False, encoding='utf-8-sig')
-            st.download_button(
-                label="📊 CSV 다운로드",
-                data=csv_data,
-                file_name=f"동반성장_뉴스_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-        
-        with col_export3:
-            st.info("📈 Excel 다운로드는 실제 크롤링 시 사용 가능합니다.")
+    if 'news_df' in st.session_state and not st.session_state['news_df'].empty:
+        news_view(st.session_state['news_df'])
 
 if __name__ == "__main__":
     main()
@@ -1,10 +1,65 @@
 import streamlit as st
-import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import datetime
+import io
 import json
 import pandas as pd
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
+# 피드 동시 수집에 사용할 최대 스레드 수
+MAX_WORKERS = 8
+
+# 피드 요청 공통 설정
+REQUEST_TIMEOUT = 10
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+}
+
+# RSS pubDate 형식 (예: Mon, 12 Oct 2026 03:00:00 GMT)
+PUBLISHED_FORMAT = '%a, %d %b %Y %H:%M:%S %Z'
+
+# Media RSS 네임스페이스 (<media:content url="...">)
+MEDIA_CONTENT_TAG = '{http://search.yahoo.com/mrss/}content'
+
+# Retry-After 대기는 소켓 타임아웃과 별개이므로, 긴 값에 작업 스레드가 묶이지 않도록 상한을 둠
+# (retry_after_max 인자는 최신 urllib3에만 있으므로 파싱 결과를 직접 제한)
+class BoundedRetry(Retry):
+    def parse_retry_after(self, retry_after):
+        """
+        Retry-After 헤더 값을 초 단위로 해석하되 REQUEST_TIMEOUT을 넘지 않도록 제한합니다.
+        """
+        return min(super().parse_retry_after(retry_after), REQUEST_TIMEOUT)
+
+# 429/503 응답은 Retry-After 헤더만큼 기다린 뒤 재시도 (고정 sleep 없이 서버 요청 제한 준수)
+RETRY_POLICY = BoundedRetry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 503),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True
+)
+
+# keep-alive 연결을 재사용하는 공용 HTTP 세션
+# Streamlit은 매 재실행마다 스크립트를 다시 실행하므로 cache_resource로 프로세스 전체에서 하나만 유지
+@st.cache_resource
+def get_http_session():
+    """
+    스레드 풀 크기보다 넉넉한 커넥션 풀을 가진 requests 세션을 반환합니다.
+    """
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=RETRY_POLICY))
+    return session
+
 # Google News RSS URL 생성 함수
 def get_google_news_rss_url(query, hl='ko', gl='KR', num_results=100):
     """
@@ -19,44 +74,81 @@ def get_google_news_rss_url(query, hl='ko', gl='KR', num_results=100):
     params = f"?q={encoded_query}&hl={hl}&gl={gl}&ceid={gl}:{hl}&num={num_results}"
     return base_url + params
 
-# RSS 피드 크롤링 및 기사 추출 함수
-def crawl_news_articles(rss_url, max_articles=20):
+# RSS 스트리밍 파싱 함수
+def parse_rss(xml_bytes):
+    """
+    RSS XML을 <item> 단위로 스트리밍 파싱하여 기사 dict를 하나씩 생성합니다.
+    처리한 요소는 바로 비워 피드 전체의 트리를 메모리에 유지하지 않습니다.
+    - xml_bytes: RSS 응답 본문 (bytes)
+    """
+    for _, item in etree.iterparse(io.BytesIO(xml_bytes), tag='item', resolve_entities=False):
+        source = item.find('source')
+        media_content = item.find(MEDIA_CONTENT_TAG)
+        yield {
+            'title': item.findtext('title', ''),
+            'link': item.findtext('link', ''),
+            'published': item.findtext('pubDate', ''),
+            'summary': item.findtext('description', ''),
+            'source': (source.text or '') if source is not None else '',
+            'media_url': media_content.get('url', '') if media_content is not None else ''
+        }
+        
+        # 이미 처리한 item과 앞선 형제 요소 해제
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+
+# RSS 피드 크롤링 및 기사 추출 함수 (10분간 인자별 결과 캐시)
+@st.cache_data(ttl=600, show_spinner=False)
+def crawl_news_articles(rss_url, max_articles=20, _feed_cache=None):
     """
     Google News RSS 피드를 파싱하여 기사 목록을 반환합니다.
     - rss_url: RSS 피드 URL
     - max_articles: 최대 기사 수
+    - _feed_cache: rss_url별 ETag/Last-Modified와 기사 목록을 보관하는 dict (조건부 요청용, 캐시 키에서 제외)
+    워커 스레드에서 호출되므로 Streamlit 출력 대신 예외를 발생시킵니다.
+    (RSS 파싱 오류는 ValueError)
     """
+    cached = _feed_cache.get(rss_url) if _feed_cache is not None else None
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('modified'):
+            headers['If-Modified-Since'] = cached['modified']
+    
+    response = get_http_session().get(rss_url, headers=headers, timeout=REQUEST_TIMEOUT)
+    
+    # 304 Not Modified: 피드가 바뀌지 않았으므로 다운로드/파싱 없이 캐시된 기사 사용
+    if response.status_code == 304 and cached:
+        return cached['articles'][:max_articles]
+    
+    response.raise_for_status()
+    
+    # 캐시 재사용 시 max_articles가 달라질 수 있으므로 전체 항목을 변환해 둠
     try:
-        feed = feedparser.parse(rss_url)
-        
-        # bozo 플래그 확인
-        if feed.get('bozo', 0) == 1:
-            error_msg = feed.get('bozo_exception', '알 수 없는 파싱 오류')
-            st.warning(f"RSS 파싱 오류: {error_msg}")
-            return []
-        
-        articles = []
-        for entry in feed.entries[:max_articles]:
-            article = {
-                'title': entry.get('title', ''),
-                'link': entry.get('link', ''),
-                'published': entry.get('published', ''),
-                'summary': entry.get('summary', ''),
-                'source': entry.get('source', {}).get('title', '') if 'source' in entry else '',
-                'media_url': entry.get('media_content', [{}])[0].get('url', '') if 'media_content' in entry else ''
-            }
-            try:
-                article['published_date'] = datetime.datetime.strptime(entry.published, '%a, %d %b %Y %H:%M:%S %Z').strftime('%Y-%m-%d %H:%M:%S')
-            except (ValueError, AttributeError):
-                article['published_date'] = entry.get('published', '날짜 정보 없음')
-            
-            articles.append(article)
-        
-        return articles
+        articles = list(parse_rss(response.content))
+    except etree.XMLSyntaxError as e:
+        raise ValueError(f"RSS 파싱 오류: {e}") from e
     
-    except Exception as e:
-        st.error(f"크롤링 중 오류 발생: {str(e)}")
-        return []
+    if _feed_cache is not None and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+        _feed_cache[rss_url] = {
+            'etag': response.headers.get('ETag'),
+            'modified': response.headers.get('Last-Modified'),
+            'articles': articles
+        }
+    
+    return articles[:max_articles]
+
+# JSON 직렬화 함수
+def to_json_bytes(records):
+    """
+    기사 목록을 들여쓰기된 UTF-8 JSON bytes로 직렬화합니다.
+    orjson이 설치되어 있으면 사용하고, 없으면 표준 json을 사용합니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(records, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(records, ensure_ascii=False, indent=2).encode('utf-8')
 
 # Streamlit 앱 메인 함수
 def main():
@@ -84,27 +176,46 @@ def main():
         queries = [q.strip() for q in query_input.split(",")]
         all_articles = []
         
+        # rss_url별 조건부 요청 캐시 (세션 동안 유지)
+        feed_cache = st.session_state.setdefault('feed_cache', {})
+        
         with st.spinner("뉴스 데이터를 크롤링 중입니다..."):
-            for query in queries:
+            # 피드 요청은 스레드 풀에서 동시에 보내고, Streamlit 출력은 메인 스레드에서 순서대로 처리
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(queries))) as executor:
+                futures = [
+                    executor.submit(crawl_news_articles, get_google_news_rss_url(query), max_articles, feed_cache)
+                    for query in queries
+                ]
+            
+            for query, future in zip(queries, futures):
                 st.write(f"크롤링 중: {query}")
-                rss_url = get_google_news_rss_url(query)
-                articles = crawl_news_articles(rss_url, max_articles)
+                try:
+                    articles = future.result()
+                except ValueError as e:
+                    st.warning(str(e))
+                    articles = []
+                except Exception as e:
+                    st.error(f"크롤링 중 오류 발생: {str(e)}")
+                    articles = []
                 all_articles.extend(articles)
                 st.write(f"  - {len(articles)}개 기사 수집")
         
-        # 중복 제거
-        seen_links = set()
-        unique_articles = []
-        for article in all_articles:
-            if article['link'] not in seen_links:
-                seen_links.add(article['link'])
-                unique_articles.append(article)
+        # 중복 제거 (링크 기준, dict는 처음 등장한 순서를 유지)
+        unique_articles = list({article['link']: article for article in all_articles}.values())
         
         st.success(f"총 {len(unique_articles)}개 고유 기사 수집 완료")
         
         # 데이터프레임으로 변환
         if unique_articles:
             df = pd.DataFrame(unique_articles)
+            
+            # 게시일은 기사별 strptime 대신 한 번의 벡터 연산으로 변환 (실패 시 원문, 없으면 안내 문구)
+            published_date = pd.to_datetime(df['published'], format=PUBLISHED_FORMAT, errors='coerce')
+            df['published_date'] = published_date.dt.strftime('%Y-%m-%d %H:%M:%S').fillna(
+                df['published'].where(df['published'] != '', '날짜 정보 없음')
+            )
+            records = df.to_dict('records')
+            
             df = df[['title', 'source', 'published_date', 'summary', 'link']]
             df.columns = ['제목', '출처', '게시일', '요약', '링크']
             
@@ -112,18 +223,15 @@ def main():
             st.subheader("크롤링 결과")
             st.dataframe(df, use_container_width=True)
             
-            # JSON 파일 다운로드 버튼
+            # JSON 파일 다운로드 버튼 (디스크를 거치지 않고 메모리에서 바로 전달)
             output_file = f"dongban_news_articles_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(unique_articles, f, ensure_ascii=False, indent=2)
-            
-            with open(output_file, 'r', encoding='utf-8') as f:
-                st.download_button(
-                    label="JSON 파일 다운로드",
-                    data=f,
-                    file_name=output_file,
-                    mime="application/json"
-                )
+            json_bytes = to_json_bytes(records)
+            st.download_button(
+                label="JSON 파일 다운로드",
+                data=json_bytes,
+                file_name=output_file,
+                mime="application/json"
+            )
         else:
             st.warning("수집된 기사가 없습니다. 키워드를 변경하거나 나중에 다시 시도하세요.")
 
@@ -132,12 +240,12 @@ if __name__ == "__main__":
 
 # 실행 방법:
 # 1. 필요한 라이브러리 설치:
-#    pip install streamlit feedparser pandas
+#    pip install streamlit requests lxml pandas
 # 2. 이 파일을 저장 (예: app.py)
 # 3. 터미널에서 실행: streamlit run app.py
 # 4. 브라우저에서 표시되는 Streamlit 앱에서 키워드 입력 및 크롤링 실행
 #
 # 주의:
 # - Google News RSS는 실시간 데이터로, 결과는 실행 시점에 따라 다를 수 있습니다.
-# - Streamlit Cloud에서 실행 중이라면, requirements.txt에 feedparser==6.0.10 등을 명시하세요.
+# - Streamlit Cloud에서 실행 중이라면, requirements.txt에 lxml 등을 명시하세요.
 # - 추가 필터링(예: 날짜 범위)은 RSS URL에 &as_qdr=d7 (최근 7일) 등을 추가하여 구현 가능.